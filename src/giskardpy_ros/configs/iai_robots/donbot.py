@@ -1,8 +1,8 @@
 import numpy as np
-import rospy
 
 from giskardpy.model.collision_avoidance_config import CollisionAvoidanceConfig
 from giskardpy.model.world_config import WorldConfig
+from giskardpy_ros.ros1.ros1_interface import get_robot_description
 from giskardpy_ros.configs.robot_interface_config import RobotInterfaceConfig, StandAloneRobotInterfaceConfig
 from giskardpy.data_types.data_types import Derivatives, PrefixName
 
@@ -21,7 +21,7 @@ class WorldWithBoxyBaseConfig(WorldConfig):
                                  Derivatives.acceleration: np.inf,
                                  Derivatives.jerk: 15})
         self.add_empty_link(PrefixName(self.map_name))
-        self.add_robot_urdf(urdf=rospy.get_param('robot_description'))
+        self.add_robot_urdf(urdf=get_robot_description())
         root_link_name = self.get_root_link_of_group(self.robot_group_name)
         self.add_6dof_joint(parent_link=self.map_name, child_link=root_link_name,
                             joint_name=self.localization_joint_name)
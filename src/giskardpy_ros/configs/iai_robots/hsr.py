@@ -1,8 +1,8 @@
 import numpy as np
-import rospy
 
 from giskardpy.model.collision_avoidance_config import CollisionAvoidanceConfig
 from giskardpy.model.world_config import WorldConfig
+from giskardpy_ros.ros1.ros1_interface import get_robot_description
 from giskardpy_ros.configs.robot_interface_config import StandAloneRobotInterfaceConfig, RobotInterfaceConfig
 from giskardpy.data_types.data_types import PrefixName, Derivatives
 
@@ -35,7 +35,7 @@ class WorldWithHSRConfig(WorldConfig):
         self.add_6dof_joint(parent_link=self.map_name, child_link=self.odom_link_name,
                             joint_name=self.localization_joint_name)
         self.add_empty_link(PrefixName(self.odom_link_name))
-        self.add_robot_urdf(urdf=rospy.get_param(self.robot_description_name))
+        self.add_robot_urdf(urdf=get_robot_description(self.robot_description_name))
         root_link_name = self.get_root_link_of_group(self.robot_group_name)
         self.add_omni_drive_joint(parent_link_name=self.odom_link_name,
                                   child_link_name=root_link_name,
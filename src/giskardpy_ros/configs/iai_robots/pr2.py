@@ -1,9 +1,8 @@
 from typing import Optional
 
-import rospy
-
 from giskardpy.model.collision_avoidance_config import CollisionAvoidanceConfig
 from giskardpy.model.world_config import WorldWithOmniDriveRobot
+from giskardpy_ros.ros1.ros1_interface import get_robot_description
 from giskardpy_ros.configs.giskard import RobotInterfaceConfig
 from giskardpy.data_types.data_types import Derivatives
 from giskardpy.model.collision_world_syncer import CollisionCheckerLib
@@ -12,7 +11,7 @@ from giskardpy.model.collision_world_syncer import CollisionCheckerLib
 class WorldWithPR2Config(WorldWithOmniDriveRobot):
     def __init__(self, map_name: str = 'map', localization_joint_name: str = 'localization',
                  odom_link_name: str = 'odom_combined', drive_joint_name: str = 'brumbrum'):
-        super().__init__(urdf=rospy.get_param('robot_description'),
+        super().__init__(urdf=get_robot_description(),
                          map_name=map_name,
                          localization_joint_name=localization_joint_name,
                          odom_link_name=odom_link_name,
@@ -6,6 +6,21 @@ from giskardpy_ros.configs.robot_interface_config import RobotInterfaceConfig, S
 from giskardpy.model.collision_world_syncer import CollisionCheckerLib
 from giskardpy.data_types.data_types import Derivatives
 
+TRACY_CONTROLLED_JOINTS = (
+    'left_shoulder_pan_joint',
+    'left_shoulder_lift_joint',
+    'left_elbow_joint',
+    'left_wrist_1_joint',
+    'left_wrist_2_joint',
+    'left_wrist_3_joint',
+    'right_shoulder_pan_joint',
+    'right_shoulder_lift_joint',
+    'right_elbow_joint',
+    'right_wrist_1_joint',
+    'right_wrist_2_joint',
+    'right_wrist_3_joint',
+)
+
 
 class TracyWorldConfig(WorldWithFixedRobot):
     def __init__(self):
@@ -31,17 +46,4 @@ class TracyJointTrajServerMujocoInterface(RobotInterfaceConfig):
 
 class TracyStandAloneRobotInterfaceConfig(StandAloneRobotInterfaceConfig):
     def __init__(self):
-        super().__init__([
-            'left_shoulder_pan_joint',
-            'left_shoulder_lift_joint',
-            'left_elbow_joint',
-            'left_wrist_1_joint',
-            'left_wrist_2_joint',
-            'left_wrist_3_joint',
-            'right_shoulder_pan_joint',
-            'right_shoulder_lift_joint',
-            'right_elbow_joint',
-            'right_wrist_1_joint',
-            'right_wrist_2_joint',
-            'right_wrist_3_joint',
-        ])
+        super().__init__(list(TRACY_CONTROLLED_JOINTS))
@@ -1,6 +1,8 @@
 from __future__ import division
+from threading import Condition
+
 import numpy as np
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Callable
 
 import rospy
 from geometry_msgs.msg import PointStamped, Point, Vector3
@@ -24,6 +26,37 @@ from giskardpy.utils.decorators import clear_memo, memoize_with_counter
 from giskardpy_ros.tree.blackboard_utils import raise_to_blackboard
 
 
+def compute_laser_thresholds(laser_scan: LaserScan, distance_threshold_width: float,
+                             distance_threshold: float) -> np.ndarray:
+    """
+    :return: one row (x, y, length, angle) per beam of laser_scan, where (x, y) is the point at which the beam
+             leaves a corridor of +-distance_threshold_width, but at most distance_threshold away from the laser.
+    """
+    if len(laser_scan.ranges) % 2 == 0:
+        print('laser range is even')
+        angles = np.arange(laser_scan.angle_min,
+                           laser_scan.angle_max,
+                           laser_scan.angle_increment)[:-1]
+    else:
+        angles = np.arange(laser_scan.angle_min,
+                           laser_scan.angle_max,
+                           laser_scan.angle_increment)
+    # all beams at once, instead of scalar np.sin/np.cos calls per beam
+    sin_angles = np.sin(angles)
+    cos_angles = np.cos(angles)
+    y = np.where(angles < 0, -1.0, 1.0) * distance_threshold_width
+    with np.errstate(divide='ignore'):
+        length = y / sin_angles
+    x = cos_angles * length
+    too_long = length > distance_threshold
+    length[too_long] = distance_threshold
+    x[too_long] = cos_angles[too_long] * distance_threshold
+    y[too_long] = sin_angles[too_long] * distance_threshold
+    thresholds = np.stack((x, y, length, angles), axis=1)
+    assert len(thresholds) == len(laser_scan.ranges)
+    return thresholds
+
+
 class RealTimePointing(Pointing):
 
     def __init__(self,
@@ -66,6 +99,8 @@ class CarryMyBullshit(Goal):
     traj_flipped: bool = False
     last_scan: LaserScan = None
     last_scan_pc: LaserScan = None
+    target_received: Condition = Condition()
+    number_of_received_targets: int = 0
 
     def __init__(self,
                  name: str,
@@ -172,17 +207,19 @@ class CarryMyBullshit(Goal):
             if CarryMyBullshit.target_sub is None:
                 CarryMyBullshit.target_sub = rospy.Subscriber(patrick_topic_name, PointStamped, self.target_cb,
                                                               queue_size=10)
-            rospy.sleep(0.5)
-            for i in range(int(wait_for_patrick_timeout)):
-                if CarryMyBullshit.trajectory.shape[0] > 5:
-                    break
-                print(f'waiting for at least 5 traj points, current length {len(CarryMyBullshit.trajectory)}')
-                rospy.sleep(1)
-            else:
+            if not self.wait_for_targets(lambda: CarryMyBullshit.trajectory.shape[0] > 5,
+                                         timeout=wait_for_patrick_timeout,
+                                         progress_msg=lambda: f'waiting for at least 5 traj points, '
+                                                              f'current length {len(CarryMyBullshit.trajectory)}'):
                 raise GoalInitalizationException(
                     f'didn\'t receive enough points after {wait_for_patrick_timeout}s')
-            get_middleware().loginfo(f'waiting for one more target point for {wait_for_patrick_timeout}s')
-            rospy.wait_for_message(patrick_topic_name, PointStamped, rospy.Duration(wait_for_patrick_timeout))
+            number_of_received_targets = CarryMyBullshit.number_of_received_targets
+            if not self.wait_for_targets(
+                    lambda: CarryMyBullshit.number_of_received_targets > number_of_received_targets,
+                    timeout=wait_for_patrick_timeout,
+                    progress_msg=lambda: f'waiting for one more target point for {wait_for_patrick_timeout}s'):
+                raise GoalInitalizationException(
+                    f'didn\'t receive a new target point after {wait_for_patrick_timeout}s')
             get_middleware().loginfo('received target point.')
 
         else:
@@ -365,6 +402,28 @@ class CarryMyBullshit(Goal):
         self.connect_hold_condition_to_all_tasks(hold_condition)
         self.connect_end_condition_to_all_tasks(end_condition)
 
+    @staticmethod
+    def wait_for_targets(predicate: Callable[[], bool], timeout: float, progress_msg: Callable[[], str]) -> bool:
+        """
+        Waits until target_cb made predicate true, logging progress_msg once per second.
+        Waits in short slices, such that the timeout is measured in ros time and shutdown is noticed.
+        :return: whether predicate became true before the timeout or shutdown
+        """
+        deadline = rospy.get_rostime() + rospy.Duration(timeout)
+        next_log = rospy.get_rostime()
+        with CarryMyBullshit.target_received:
+            while not rospy.is_shutdown():
+                now = rospy.get_rostime()
+                if now >= next_log:
+                    get_middleware().loginfo(progress_msg())
+                    next_log = now + rospy.Duration(1)
+                remaining = (deadline - now).to_sec()
+                if remaining <= 0:
+                    return predicate()
+                if CarryMyBullshit.target_received.wait_for(predicate, timeout=min(remaining, 0.5)):
+                    return True
+        return False
+
     def clean_up(self):
         if CarryMyBullshit.target_sub is not None:
             CarryMyBullshit.target_sub.unregister()
@@ -377,35 +436,8 @@ class CarryMyBullshit(Goal):
             CarryMyBullshit.point_cloud_laser_sub = None
 
     def init_laser_stuff(self, laser_scan: LaserScan):
-        thresholds = []
-        if len(laser_scan.ranges) % 2 == 0:
-            print('laser range is even')
-            angles = np.arange(laser_scan.angle_min,
-                               laser_scan.angle_max,
-                               laser_scan.angle_increment)[:-1]
-        else:
-            angles = np.arange(laser_scan.angle_min,
-                               laser_scan.angle_max,
-                               laser_scan.angle_increment)
-        for angle in angles:
-            if angle < 0:
-                y = -self.laser_distance_threshold_width
-                length = y / np.sin((angle))
-                x = np.cos(angle) * length
-                thresholds.append((x, y, length, angle))
-            else:
-                y = self.laser_distance_threshold_width
-                length = y / np.sin((angle))
-                x = np.cos(angle) * length
-                thresholds.append((x, y, length, angle))
-            if length > self.laser_distance_threshold:
-                length = self.laser_distance_threshold
-                x = np.cos(angle) * length
-                y = np.sin(angle) * length
-                thresholds[-1] = (x, y, length, angle)
-        thresholds = np.array(thresholds)
-        assert len(thresholds) == len(laser_scan.ranges)
-        return thresholds
+        return compute_laser_thresholds(laser_scan, self.laser_distance_threshold_width,
+                                        self.laser_distance_threshold)
 
     def muddle_laser_scan(self, scan: LaserScan, thresholds: np.ndarray):
         data = np.array(scan.ranges)
@@ -647,6 +679,9 @@ class CarryMyBullshit(Goal):
             self.human_point = point
         except Exception as e:
             get_middleware().logwarn(f'rejected new target because: {e}')
+        with CarryMyBullshit.target_received:
+            CarryMyBullshit.number_of_received_targets += 1
+            CarryMyBullshit.target_received.notify_all()
         self.publish_trajectory()
 
 
@@ -920,35 +955,8 @@ class FollowNavPath(Goal):
             sub.unregister()
 
     def init_laser_stuff(self, laser_scan: LaserScan):
-        thresholds = []
-        if len(laser_scan.ranges) % 2 == 0:
-            print('laser range is even')
-            angles = np.arange(laser_scan.angle_min,
-                               laser_scan.angle_max,
-                               laser_scan.angle_increment)[:-1]
-        else:
-            angles = np.arange(laser_scan.angle_min,
-                               laser_scan.angle_max,
-                               laser_scan.angle_increment)
-        for angle in angles:
-            if angle < 0:
-                y = -self.laser_distance_threshold_width
-                length = y / np.sin((angle))
-                x = np.cos(angle) * length
-                thresholds.append((x, y, length, angle))
-            else:
-                y = self.laser_distance_threshold_width
-                length = y / np.sin((angle))
-                x = np.cos(angle) * length
-                thresholds.append((x, y, length, angle))
-            if length > self.laser_distance_threshold:
-                length = self.laser_distance_threshold
-                x = np.cos(angle) * length
-                y = np.sin(angle) * length
-                thresholds[-1] = (x, y, length, angle)
-        thresholds = np.array(thresholds)
-        assert len(thresholds) == len(laser_scan.ranges)
-        return thresholds
+        return compute_laser_thresholds(laser_scan, self.laser_distance_threshold_width,
+                                        self.laser_distance_threshold)
 
     def muddle_laser_scan(self, scan: LaserScan, thresholds: np.ndarray):
         data = np.array(scan.ranges)
@@ -1,36 +1,76 @@
-from typing import List, Type, Optional
+from time import time
+from typing import List, Type, Optional, Dict
 
 import genpy
 import rospy
-import rostopic
 from geometry_msgs.msg import PoseStamped, Point, Quaternion
 from rospy import ROSException
-from rostopic import ROSTopicException
 
 from giskardpy.middleware import get_middleware
 
 
+# how long one answer of the master about topic types is shared between callers, in seconds
+TOPIC_TYPES_MAX_AGE: float = 0.5
+
+_topic_types: Dict[str, str] = {}
+_topic_types_stamp: float = -1
+
+
+def get_topic_types(max_age: float = TOPIC_TYPES_MAX_AGE) -> Dict[str, str]:
+    """
+    Maps the names of all topics known to the master to their type strings.
+    The answer of the master is shared for max_age seconds, such that behaviors that wait for their topics
+    during startup cause one master query, instead of one each.
+    """
+    global _topic_types, _topic_types_stamp
+    now = time()
+    if now - _topic_types_stamp > max_age:
+        import rosgraph
+        _topic_types = dict(rosgraph.Master(rospy.get_name()).getTopicTypes())
+        _topic_types_stamp = now
+    return _topic_types
+
+
 def wait_for_topic_to_appear(topic_name: str,
                              supported_types: Optional[List[Type[genpy.Message]]] = None,
-                             sleep_time: float = 1) \
+                             sleep_time: float = 1,
+                             timeout: Optional[float] = None) \
         -> Type[genpy.Message]:
-    waiting_message = f'Waiting for topic \'{topic_name}\' to appear...'
-    msg_type = None
-    while msg_type is None and not rospy.is_shutdown():
-        get_middleware().loginfo(waiting_message)
+    """
+    Blocks until topic_name is known to the master and returns its message class.
+    Each poll costs at most one master query, see get_topic_types; the time between polls is spent sleeping.
+    :param timeout: in seconds, None = wait forever
+    """
+    import rosgraph
+    from roslib.message import get_message_class
+    get_middleware().loginfo(f'Waiting for topic \'{topic_name}\' to appear...')
+    deadline = None if timeout is None else rospy.get_rostime() + rospy.Duration(timeout)
+    while not rospy.is_shutdown():
         try:
-            rostopic.get_info_text(topic_name)
-            msg_type, _, _ = rostopic.get_topic_class(topic_name)
-            if msg_type is None:
-                raise ROSTopicException()
+            type_str = get_topic_types().get(topic_name)
+        except (rosgraph.MasterException, OSError):
+            type_str = None
+        msg_type = get_message_class(type_str) if type_str is not None else None
+        if msg_type is not None:
             if supported_types is not None and msg_type not in supported_types:
                 raise TypeError(f'Topic of type \'{msg_type}\' is not supported. '
                                 f'Must be one of: \'{supported_types}\'')
-            else:
-                get_middleware().loginfo(f'\'{topic_name}\' appeared.')
-                return msg_type
-        except (ROSException, ROSTopicException) as e:
-            rospy.sleep(sleep_time)
+            get_middleware().loginfo(f'\'{topic_name}\' appeared.')
+            return msg_type
+        if deadline is not None and rospy.get_rostime() >= deadline:
+            raise ROSException(f'Timeout while waiting for topic \'{topic_name}\'.')
+        rospy.sleep(sleep_time)
+
+
+def get_robot_description(parameter_name: str = 'robot_description') -> str:
+    """
+    One-shot lookup of the urdf on the parameter server.
+    """
+    try:
+        return rospy.get_param(parameter_name)
+    except KeyError:
+        raise KeyError(f'Parameter \'{rospy.resolve_name(parameter_name)}\' not found, '
+                       f'is the robot description uploaded?')
 
 
 def make_pose_from_parts(pose, frame_id, position, orientation):
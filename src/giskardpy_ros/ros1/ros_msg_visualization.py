@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Optional, List, Dict, Union
 
 from line_profiler import profile
-from tf.transformations import rotation_matrix, quaternion_from_matrix
+from tf.transformations import quaternion_from_matrix
 
 import giskardpy.casadi_wrapper as cas
 import numpy as np
@@ -23,6 +23,17 @@ from giskardpy_ros.ros1.visualization_mode import VisualizationMode
 from giskardpy_ros.tree.blackboard_utils import GiskardBlackboard
 from giskardpy.model.trajectory import Trajectory
 
+# constant rotations that turn the z axis of a cylinder marker onto the x or y axis of a debug frame,
+# written out instead of calling rotation_matrix for every debug frame
+d_R_x = np.array([[0, 0, 1, 0],
+                  [0, 1, 0, 0],
+                  [-1, 0, 0, 0],
+                  [0, 0, 0, 1]], dtype=float)
+d_R_y = np.array([[1, 0, 0, 0],
+                  [0, 0, 1, 0],
+                  [0, -1, 0, 0],
+                  [0, 0, 0, 1]], dtype=float)
+
 
 class ROSMsgVisualization:
     red = ColorRGBA(r=1.0, g=0.0, b=0.0, a=1.0)
@@ -265,7 +276,6 @@ class ROSMsgVisualization:
                 mx.pose.position.x = map_P_d[0][0] + map_V_x_offset[0]
                 mx.pose.position.y = map_P_d[1][0] + map_V_x_offset[1]
                 mx.pose.position.z = map_P_d[2][0] + map_V_x_offset[2]
-                d_R_x = rotation_matrix(np.pi / 2, [0, 1, 0])
                 map_R_x = np.dot(map_T_d, d_R_x)
                 mx.pose.orientation = Quaternion(*quaternion_from_matrix(map_R_x))
                 mx.color = ColorRGBA(1, 0, 0, 1)
@@ -285,7 +295,6 @@ class ROSMsgVisualization:
                 my.pose.position.x = map_P_d[0][0] + map_V_y_offset[0]
                 my.pose.position.y = map_P_d[1][0] + map_V_y_offset[1]
                 my.pose.position.z = map_P_d[2][0] + map_V_y_offset[2]
-                d_R_y = rotation_matrix(-np.pi / 2, [1, 0, 0])
                 map_R_y = np.dot(map_T_d, d_R_y)
                 my.pose.orientation = Quaternion(*quaternion_from_matrix(map_R_y))
                 my.color = ColorRGBA(0, 1, 0, 1)
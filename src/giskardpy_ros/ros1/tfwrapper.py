@@ -1,3 +1,4 @@
+import math
 from typing import Optional, overload, List
 
 import genpy
@@ -205,14 +206,11 @@ def lookup_point(target_frame: str, source_frame: str, time: Optional[rospy.Time
 
 @profile
 def normalize_quaternion_msg(quaternion: Quaternion) -> Quaternion:
-    q = Quaternion()
-    rotation = np.array([quaternion.x,
-                         quaternion.y,
-                         quaternion.z,
-                         quaternion.w])
-    normalized_rotation = rotation / np.linalg.norm(rotation)
-    q.x = normalized_rotation[0]
-    q.y = normalized_rotation[1]
-    q.z = normalized_rotation[2]
-    q.w = normalized_rotation[3]
-    return q
+    # plain floats, np.linalg.norm on a 4-vector is dominated by numpy overhead
+    x, y, z, w = quaternion.x, quaternion.y, quaternion.z, quaternion.w
+    norm = math.sqrt(x * x + y * y + z * z + w * w)
+    if norm == 0:
+        # a zero quaternion can't be normalized
+        return quaternion
+    inv_norm = 1.0 / norm
+    return Quaternion(x * inv_norm, y * inv_norm, z * inv_norm, w * inv_norm)
@@ -1,9 +1,7 @@
-from queue import Queue, Empty
+from threading import Event
 from typing import Any
 
 import actionlib
-import rosnode
-import rospy
 from line_profiler import profile
 
 from giskard_msgs.msg import MoveGoal
@@ -18,7 +16,6 @@ class ActionServerHandler:
     """
     goal_id: int
     name: str
-    client_alive_checker: rospy.Timer
     client_alive: bool
 
     @record_time
@@ -27,9 +24,12 @@ class ActionServerHandler:
         self.goal_id = -1
         self.goal_msg = None
         self._result_msg = None
-        self.client_alive_checker = None
-        self.goal_queue = Queue(1)
-        self.result_queue = Queue(1)
+        self.client_alive = True
+        self._client_name = None
+        self._goal_slot = None
+        self._goal_event = Event()
+        self._result_slot = None
+        self._result_event = Event()
         self._as = actionlib.SimpleActionServer(self.name, action_type,
                                                 execute_cb=self.execute_cb, auto_start=False)
         self._as.start()
@@ -44,32 +44,45 @@ class ActionServerHandler:
         return MoveGoal.UNDEFINED == self.goal_msg.type
 
     def execute_cb(self, goal) -> None:
-        self.goal_queue.put(goal)
-        result_cb = self.result_queue.get()
-        self.client_alive_checker.shutdown()
-        result_cb()
+        self._goal_slot = goal
+        self._goal_event.set()
+        self._result_event.wait()
+        self._result_event.clear()
+        set_result = self._result_slot
+        self._result_slot = None
+        self._client_name = None
+        set_result(self.result_msg)
         self.goal_msg = None
         self.result_msg = None
 
-    def is_client_alive(self) -> bool:
-        return self.client_alive
+    def is_client_connected(self, client_name: str) -> bool:
+        """
+        Action clients subscribe to the status topic of the server, which is published periodically.
+        The tcp connection of a client that died is therefore dropped quickly, without having to ask the client.
+        """
+        return any(connection.endpoint_id == client_name
+                   for connection in self._as.action_server.status_pub.impl.connections)
 
     @profile
-    def ping_client(self, time):
-        client_name = self._as.current_goal.goal.goal_id.id.split('-')[0]
-        self.client_alive = rosnode.rosnode_ping(client_name, max_count=1)
-        if not self.client_alive:
+    def is_client_alive(self) -> bool:
+        client_name = self._client_name
+        if client_name is not None and not self.is_client_connected(client_name):
             get_middleware().logerr(f'Lost connection to Client "{client_name}".')
-            self.client_alive_checker.shutdown()
+            self._client_name = None
+            self.client_alive = False
+        return self.client_alive
 
     def accept_goal(self) -> None:
-        try:
-            self.goal_msg = self.goal_queue.get_nowait()
-            self.client_alive = True
-            self.client_alive_checker = rospy.Timer(period=rospy.Duration(1), callback=self.ping_client)
-            self.goal_id += 1
-        except Empty:
+        if not self._goal_event.is_set():
             return None
+        self.goal_msg = self._goal_slot
+        self._goal_slot = None
+        self._goal_event.clear()
+        self.client_alive = True
+        client_name = self._as.current_goal.goal.goal_id.id.split('-')[0]
+        # clients that don't listen to the status topic, e.g. rostopic pub, can't be monitored
+        self._client_name = client_name if self.is_client_connected(client_name) else None
+        self.goal_id += 1
 
     @property
     def result_msg(self):
@@ -82,28 +95,23 @@ class ActionServerHandler:
         self._result_msg = value
 
     def has_goal(self):
-        return not self.goal_queue.empty()
+        return self._goal_event.is_set()
+
+    def _set_result(self, set_result) -> None:
+        self._result_slot = set_result
+        self._result_event.set()
 
     def send_feedback(self, message):
         self._as.publish_feedback(message)
 
     def send_preempted(self):
-        def call_me_now():
-            self._as.set_preempted(self.result_msg)
-
-        self.result_queue.put(call_me_now)
+        self._set_result(self._as.set_preempted)
 
     def send_aborted(self):
-        def call_me_now():
-            self._as.set_aborted(self.result_msg)
-
-        self.result_queue.put(call_me_now)
+        self._set_result(self._as.set_aborted)
 
     def send_result(self):
-        def call_me_now():
-            self._as.set_succeeded(self.result_msg)
-
-        self.result_queue.put(call_me_now)
+        self._set_result(self._as.set_succeeded)
 
     def is_preempt_requested(self):
         return self._as.is_preempt_requested()
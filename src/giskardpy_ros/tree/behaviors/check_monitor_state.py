@@ -8,6 +8,9 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+SUCCESS = Status.SUCCESS
+RUNNING = Status.RUNNING
+
 
 class CheckMonitorState(GiskardBehavior):
     @profile
@@ -21,5 +24,5 @@ class CheckMonitorState(GiskardBehavior):
     @profile
     def update(self):
         if god_map.monitor_manager.life_cycle_state[self.monitor.id] == TaskState.running:
-            return Status.SUCCESS
-        return Status.RUNNING
+            return SUCCESS
+        return RUNNING
@@ -18,22 +18,20 @@ class CleanUp(GiskardBehavior):
     def __init__(self, name, clear_markers=False):
         super().__init__(name)
         self.clear_markers_ = clear_markers
-        self.marker_pub = rospy.Publisher('~visualization_marker_array', MarkerArray, queue_size=10)
+        self.marker_pub = rospy.Publisher('~visualization_marker_array', MarkerArray, queue_size=10, latch=True)
+        self.clear_markers_msg = MarkerArray(markers=[Marker(action=Marker.DELETEALL)])
 
     def clear_markers(self):
-        msg = MarkerArray()
-        marker = Marker()
-        marker.action = Marker.DELETEALL
-        msg.markers.append(marker)
-        self.marker_pub.publish(msg)
+        self.marker_pub.publish(self.clear_markers_msg)
 
     @record_time
     @profile
     def initialise(self):
-        if self.clear_markers_:
-            self.clear_markers()
-        if GiskardBlackboard().tree.control_loop_branch.publish_state.debug_marker_publisher is not None:
+        debug_marker_publisher_active = \
+            GiskardBlackboard().tree.control_loop_branch.publish_state.debug_marker_publisher is not None
+        if self.clear_markers_ or debug_marker_publisher_active:
             self.clear_markers()
+        if debug_marker_publisher_active:
             GiskardBlackboard().ros_visualizer.publish_markers(force=True)
         GiskardBlackboard().giskard.set_defaults()
         god_map.world.compiled_all_fks = None
@@ -8,6 +8,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 class CollisionChecker(GiskardBehavior):
     @profile
@@ -39,4 +41,4 @@ class CollisionChecker(GiskardBehavior):
         collisions = god_map.collision_scene.check_collisions()
         self.are_self_collisions_violated(collisions)
         god_map.closest_point = collisions
-        return Status.RUNNING
+        return RUNNING
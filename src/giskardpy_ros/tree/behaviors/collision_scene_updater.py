@@ -8,6 +8,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+SUCCESS = Status.SUCCESS
+
 
 class CollisionSceneUpdater(GiskardBehavior):
     def __init__(self):
@@ -18,4 +20,4 @@ class CollisionSceneUpdater(GiskardBehavior):
     @profile
     def update(self):
         god_map.collision_scene.sync()
-        return Status.SUCCESS
+        return SUCCESS
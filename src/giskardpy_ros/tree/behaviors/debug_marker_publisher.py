@@ -16,6 +16,8 @@ from giskardpy.utils.decorators import record_time
 from giskardpy.utils.math import rotation_matrix_from_axis_angle, quaternion_from_rotation_matrix
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard, GiskardBlackboard
 
+SUCCESS = Status.SUCCESS
+
 
 class DebugMarkerPublisher(GiskardBehavior):
 
@@ -51,7 +53,7 @@ class DebugMarkerPublisher(GiskardBehavior):
             markers = GiskardBlackboard().ros_visualizer.debug_state_to_vectors_markers(debug_exprs, debug_state)
             ms.markers.extend(markers)
             self.marker_pub.publish(ms)
-        return Status.SUCCESS
+        return SUCCESS
 
 
 class DebugMarkerPublisherTrajectory(GiskardBehavior):
@@ -74,4 +76,4 @@ class DebugMarkerPublisherTrajectory(GiskardBehavior):
                                                                         raw_debug_trajectory=debug_traj,
                                                                         joint_space_traj=god_map.trajectory,
                                                                         every_x=self.every_x)
-        return Status.SUCCESS
+        return SUCCESS
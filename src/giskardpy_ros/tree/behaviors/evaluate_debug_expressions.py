@@ -9,6 +9,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 class EvaluateDebugExpressions(GiskardBehavior):
     controller: QPController = None
@@ -22,5 +24,5 @@ class EvaluateDebugExpressions(GiskardBehavior):
     @profile
     def update(self):
         god_map.debug_expression_manager.eval_debug_expressions(self.log_traj)
-        return Status.RUNNING
+        return RUNNING
 
@@ -5,14 +5,20 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+SUCCESS = Status.SUCCESS
+
 
 class EvaluateMonitors(GiskardBehavior):
 
     def __init__(self, name: str = 'evaluate monitors'):
         super().__init__(name)
 
+    def initialise(self):
+        # the monitors are compiled before the control loop starts, bind the method once per motion
+        self.evaluate_monitors = god_map.monitor_manager.evaluate_monitors
+
     @catch_and_raise_to_blackboard
     @record_time
     def update(self):
-        god_map.monitor_manager.evaluate_monitors()
-        return Status.SUCCESS
+        self.evaluate_monitors()
+        return SUCCESS
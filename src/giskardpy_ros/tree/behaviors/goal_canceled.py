@@ -5,9 +5,11 @@ from giskardpy.data_types.exceptions import PreemptedException
 from giskardpy_ros.tree.behaviors.action_server import ActionServerHandler
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.middleware import get_middleware
-from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import raise_to_blackboard
 
+SUCCESS = Status.SUCCESS
+FAILURE = Status.FAILURE
+
 
 class GoalCanceled(GiskardBehavior):
     @profile
@@ -16,15 +18,16 @@ class GoalCanceled(GiskardBehavior):
         self.action_server = action_server
         super().__init__(name)
 
-    @record_time
     @profile
     def update(self) -> Status:
-        if (self.action_server.is_preempt_requested() and self.get_blackboard_exception() is None or
+        exception = self.get_blackboard_exception()
+        if (exception is None and self.action_server.is_preempt_requested() or
                 not self.action_server.is_client_alive()):
             msg = f'\'{self.action_server.name}\' preempted'
             get_middleware().logerr(msg)
             raise_to_blackboard(PreemptedException(msg))
-        if self.get_blackboard_exception() is not None:
-            return Status.SUCCESS
+            return SUCCESS
+        if exception is not None:
+            return SUCCESS
         else:
-            return Status.FAILURE
+            return FAILURE
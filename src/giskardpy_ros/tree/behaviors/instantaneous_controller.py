@@ -8,6 +8,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 class ControllerPlugin(GiskardBehavior):
     controller: QPController = None
@@ -29,5 +31,5 @@ class ControllerPlugin(GiskardBehavior):
         # non_negative_entries = goal_reached_panda['data'] >= 0
         # if (goal_reached_panda.loc[non_negative_entries]['data'] == 0).any():
         #     return Status.RUNNING
-        return Status.RUNNING
+        return RUNNING
 
@@ -10,6 +10,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 class JointGroupVelController(GiskardBehavior):
     @profile
@@ -41,7 +43,7 @@ class JointGroupVelController(GiskardBehavior):
         for i, joint_name in enumerate(self.joint_names):
             msg.data.append(god_map.world.state[joint_name].velocity)
         self.cmd_pub.publish(msg)
-        return Status.RUNNING
+        return RUNNING
 
     def terminate(self, new_status):
         msg = Float64MultiArray()
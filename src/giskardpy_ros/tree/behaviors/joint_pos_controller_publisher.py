@@ -11,6 +11,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 class JointPosController(GiskardBehavior):
     last_time: float
@@ -40,4 +42,4 @@ class JointPosController(GiskardBehavior):
         for i, joint_name in enumerate(self.joint_names):
             msg.data = god_map.world.state[joint_name].position
             self.publishers[i].publish(msg)
-        return Status.RUNNING
+        return RUNNING
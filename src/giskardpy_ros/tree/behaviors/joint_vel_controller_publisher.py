@@ -11,6 +11,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 class JointVelController(GiskardBehavior):
     last_time: float
@@ -41,7 +43,7 @@ class JointVelController(GiskardBehavior):
         for i, joint_name in enumerate(self.joint_names):
             msg.data = god_map.world.state[joint_name].velocity
             self.publishers[i].publish(msg)
-        return Status.RUNNING
+        return RUNNING
 
     def terminate(self, new_status):
         super().terminate(new_status)
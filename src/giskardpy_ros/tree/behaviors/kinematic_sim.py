@@ -6,6 +6,8 @@ from giskardpy.god_map import god_map
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 
+SUCCESS = Status.SUCCESS
+
 
 class KinSimPlugin(GiskardBehavior):
     @profile
@@ -22,4 +24,4 @@ class KinSimPlugin(GiskardBehavior):
         god_map.world.update_state(next_cmds, god_map.qp_controller.sample_period,
                                    max_derivative=god_map.qp_controller.max_derivative)
         # god_map.world.notify_state_change()
-        return Status.SUCCESS
+        return SUCCESS
@@ -7,6 +7,8 @@ from giskardpy.god_map import god_map
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 
+SUCCESS = Status.SUCCESS
+
 
 class LogTrajPlugin(GiskardBehavior):
     @record_time
@@ -14,4 +16,4 @@ class LogTrajPlugin(GiskardBehavior):
     def update(self):
         current_js = deepcopy(god_map.world.state)
         god_map.trajectory.set(god_map.control_cycle_counter, current_js)
-        return Status.SUCCESS
+        return SUCCESS
@@ -6,6 +6,8 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 from giskardpy.utils.decorators import record_time
 
+SUCCESS = Status.SUCCESS
+
 
 class NotifyStateChange(GiskardBehavior):
 
@@ -13,7 +15,7 @@ class NotifyStateChange(GiskardBehavior):
     @profile
     def update(self):
         god_map.world.notify_state_change()
-        return Status.SUCCESS
+        return SUCCESS
 
 
 class NotifyModelChange(GiskardBehavior):
@@ -23,4 +25,4 @@ class NotifyModelChange(GiskardBehavior):
     @profile
     def update(self):
         god_map.world._notify_model_change()
-        return Status.SUCCESS
+        return SUCCESS
@@ -26,9 +26,11 @@ class PlotGanttChart(GiskardBehavior):
         super().__init__(name)
 
     def plot_gantt_chart(self, goals: List[Goal], monitors: List[Monitor], file_name: str):
-        monitor_plot_filter = np.array([monitor.plot for monitor in god_map.monitor_manager.monitors.values()])
+        monitor_plot_filter = np.array([monitor.plot for monitor in god_map.monitor_manager.monitors.values()],
+                                       dtype=bool)
         tasks = [task for g in goals for task in g.tasks]
-        task_plot_filter = np.array([not isinstance(g, CollisionAvoidance) for g in goals for _ in g.tasks])
+        task_plot_filter = np.array([not isinstance(g, CollisionAvoidance) for g in goals for _ in g.tasks],
+                                    dtype=bool)
 
         monitor_history, task_history = self.get_new_history()
         num_monitors = monitor_plot_filter.tolist().count(True)
@@ -81,21 +83,25 @@ class PlotGanttChart(GiskardBehavior):
                              filter: np.ndarray,
                              bar_height: float = 0.8):
         color_map = plot_motion_graph.monitor_state_to_color
-        state = {t.name: (0, 0, TaskState.not_started) for t in things}
+        start_times = np.zeros(len(things))
+        last_bool_states = np.zeros(len(things), dtype=object)
+        last_states = np.full(len(things), TaskState.not_started, dtype=object)
         for end_time, (bool_states, history_states) in history:
-            for thing_id, status in enumerate(history_states):
-                bool_status = bool_states[thing_id]
-                if not filter[thing_id]:
-                    continue
+            bool_states = np.asarray(bool_states, dtype=object)
+            history_states = np.asarray(history_states, dtype=object)
+            # one mask for all flips, only monitors that actually changed are visited
+            flipped = filter & ((history_states != last_states) | (bool_states != last_bool_states))
+            for thing_id in np.flatnonzero(flipped):
                 thing = things[thing_id]
-                start_time, last_bool_status, last_status = state[thing.name]
-                outer_color, inner_color = color_map[last_status, last_bool_status]
-                if status != last_status or bool_status != last_bool_status:
-                    plt.barh(thing.name[:50], end_time - start_time, height=bar_height, left=start_time,
-                             color=outer_color, zorder=2)
-                    plt.barh(thing.name[:50], end_time - start_time, height=bar_height / 2, left=start_time,
-                             color=inner_color, zorder=2)
-                    state[thing.name] = (end_time, bool_status, status)
+                start_time = start_times[thing_id]
+                outer_color, inner_color = color_map[last_states[thing_id], last_bool_states[thing_id]]
+                plt.barh(thing.name[:50], end_time - start_time, height=bar_height, left=start_time,
+                         color=outer_color, zorder=2)
+                plt.barh(thing.name[:50], end_time - start_time, height=bar_height / 2, left=start_time,
+                         color=inner_color, zorder=2)
+            start_times[flipped] = end_time
+            last_bool_states[flipped] = bool_states[flipped]
+            last_states[flipped] = history_states[flipped]
 
     def get_new_history(self) \
             -> Tuple[List[Tuple[float, Tuple[np.ndarray, np.ndarray]]],
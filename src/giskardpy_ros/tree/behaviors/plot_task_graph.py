@@ -22,10 +22,6 @@ def extract_monitor_names_from_condition(condition: str) -> List[str]:
     return re.findall(r"'(.*?)'", condition)
 
 
-def search_for_monitor(monitor_name: str, execution_state: ExecutionState) -> giskard_msgs.Monitor:
-    return [m for m in execution_state.monitors if m.name == monitor_name][0]
-
-
 task_state_to_color: Dict[TaskState, str] = {
     TaskState.not_started: 'black',
     TaskState.running: 'green',
@@ -85,6 +81,7 @@ def format_msg(msg: Union[giskard_msgs.Monitor, giskard_msgs.MotionGoal]) -> str
 
 def execution_state_to_dot_graph(execution_state: ExecutionState) -> pydot.Dot:
     graph = pydot.Dot(graph_type='digraph')
+    monitors_by_name: Dict[str, giskard_msgs.Monitor] = {m.name: m for m in execution_state.monitors}
 
     def add_or_get_node(thing: Union[giskard_msgs.Monitor, giskard_msgs.MotionGoal]):
         node_id = format_msg(thing)
@@ -115,7 +112,7 @@ def execution_state_to_dot_graph(execution_state: ExecutionState) -> pydot.Dot:
              execution_state.monitor_state[i])]
         free_symbols = extract_monitor_names_from_condition(monitor.start_condition)
         for sub_monitor_name in free_symbols:
-            sub_monitor = search_for_monitor(sub_monitor_name, execution_state)
+            sub_monitor = monitors_by_name[sub_monitor_name]
             sub_monitor_node = add_or_get_node(sub_monitor)
             graph.add_edge(pydot.Edge(sub_monitor_node, monitor_node, color='green'))
 
@@ -125,17 +122,17 @@ def execution_state_to_dot_graph(execution_state: ExecutionState) -> pydot.Dot:
         goal_node = add_or_get_node(task)
         goal_node.obj_dict['attributes']['color'] = task_state_to_color[execution_state.task_state[i]]
         for monitor_name in extract_monitor_names_from_condition(task.start_condition):
-            monitor = search_for_monitor(monitor_name, execution_state)
+            monitor = monitors_by_name[monitor_name]
             monitor_node = add_or_get_node(monitor)
             graph.add_edge(pydot.Edge(monitor_node, goal_node, color='green'))
 
         for monitor_name in extract_monitor_names_from_condition(task.hold_condition):
-            monitor = search_for_monitor(monitor_name, execution_state)
+            monitor = monitors_by_name[monitor_name]
             monitor_node = add_or_get_node(monitor)
             graph.add_edge(pydot.Edge(monitor_node, goal_node, color='orange'))
 
         for monitor_name in extract_monitor_names_from_condition(task.end_condition):
-            monitor = search_for_monitor(monitor_name, execution_state)
+            monitor = monitors_by_name[monitor_name]
             monitor_node = add_or_get_node(monitor)
             graph.add_edge(pydot.Edge(goal_node, monitor_node, color='red', arrowhead='none', arrowtail='normal',
                                       dir='both'))
@@ -9,6 +9,8 @@ from giskardpy.qp.qp_controller import QPController
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 
+SUCCESS = Status.SUCCESS
+
 
 class PublishDebugExpressions(GiskardBehavior):
     @profile
@@ -136,4 +138,4 @@ class PublishDebugExpressions(GiskardBehavior):
         qp_controller: QPController = god_map.qp_controller
         msg = self.create_msg(qp_controller)
         self.publisher.publish(msg)
-        return Status.SUCCESS
+        return SUCCESS
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Optional
+from typing import Optional, Tuple
 
 from line_profiler import profile
 
@@ -16,15 +16,39 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard, GiskardBlackboard
 
+SUCCESS = Status.SUCCESS
+
+_motion_graph_key: Optional[Tuple[int, int, int]] = None
+_motion_graph: Tuple[np.ndarray, np.ndarray, list, list]
+
+
+def get_motion_graph(goal_id: int) -> Tuple[np.ndarray, np.ndarray, list, list]:
+    """
+    Plot filters and msgs of all monitors and tasks. They only change when a new goal is parsed,
+    therefore they are rebuilt only if the goal id or the number of monitors/tasks changed.
+    :return: monitor_filter, task_filter, monitor msgs, task msgs
+    """
+    global _motion_graph_key, _motion_graph
+    monitors = god_map.monitor_manager.monitors
+    tasks = god_map.motion_goal_manager.tasks
+    key = (goal_id, len(monitors), len(tasks))
+    if key != _motion_graph_key:
+        monitor_filter = np.array([monitor.plot for monitor in monitors.values()])
+        task_filter = np.array([task.plot for task in tasks.values()])
+        monitor_msgs = [msg_converter.monitor_to_ros_msg(m) for m in monitors.values() if m.plot]
+        task_msgs = [msg_converter.task_to_ros_msg(t) for t in tasks.values() if t.plot]
+        _motion_graph = (monitor_filter, task_filter, monitor_msgs, task_msgs)
+        _motion_graph_key = key
+    return _motion_graph
+
 
 def giskard_state_to_execution_state() -> ExecutionState:
-    monitor_filter = np.array([monitor.plot for monitor in god_map.monitor_manager.monitors.values()])
-    task_filter = np.array([task.plot for task in god_map.motion_goal_manager.tasks.values()])
     msg = ExecutionState()
     msg.header.stamp = rospy.Time.now()
     msg.goal_id = GiskardBlackboard().move_action_server.goal_id
-    msg.monitors = [msg_converter.monitor_to_ros_msg(m) for m in god_map.monitor_manager.monitors.values() if m.plot]
-    msg.tasks = [msg_converter.task_to_ros_msg(t) for t in god_map.motion_goal_manager.tasks.values() if t.plot]
+    monitor_filter, task_filter, monitor_msgs, task_msgs = get_motion_graph(msg.goal_id)
+    msg.monitors = list(monitor_msgs)
+    msg.tasks = list(task_msgs)
     try:
         msg.monitor_state = god_map.monitor_manager.state_history[-1][1][0][monitor_filter].tolist()
         msg.monitor_life_cycle_state = god_map.monitor_manager.state_history[-1][1][1][monitor_filter].tolist()
@@ -64,11 +88,19 @@ class PublishFeedback(GiskardBehavior):
         super().__init__(name)
         self.cmd_topic = topic_name
         self.pub = rospy.Publisher(self.cmd_topic, ExecutionState, queue_size=10, latch=True)
+        self.last_history_key = None
 
     @record_time
     @profile
     def update(self):
+        # nothing was appended to the state histories since the last tick -> nothing new to publish
+        history_key = (GiskardBlackboard().move_action_server.goal_id,
+                       len(god_map.monitor_manager.state_history),
+                       len(god_map.motion_goal_manager.state_history))
+        if history_key == self.last_history_key:
+            return SUCCESS
+        self.last_history_key = history_key
         if did_state_change():
             msg = giskard_state_to_execution_state()
             self.pub.publish(msg)
-        return Status.SUCCESS
+        return SUCCESS
@@ -10,6 +10,8 @@ from py_trees import Status
 from giskardpy.god_map import god_map
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 
+SUCCESS = Status.SUCCESS
+
 
 class PublishJointState(GiskardBehavior):
     @profile
@@ -40,4 +42,4 @@ class PublishJointState(GiskardBehavior):
             msg.velocity.append(god_map.world.state[joint_name].velocity)
         msg.header.stamp = rospy.get_rostime()
         self.cmd_pub.publish(msg)
-        return Status.SUCCESS
+        return SUCCESS
@@ -1,19 +1,27 @@
 from line_profiler import profile
 from py_trees import Status
 
+from giskardpy.data_types.data_types import Derivatives
 from giskardpy.god_map import god_map
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 from giskardpy.utils.utils import is_running_in_pytest
 
+RUNNING = Status.RUNNING
+
 
 class RealKinSimPlugin(GiskardBehavior):
     last_time: float
+    sample_period: float
+    max_derivative: Derivatives
     print_warning = is_running_in_pytest()
 
     def initialise(self):
         self.last_time = None
+        # the qp controller doesn't change during a motion
+        self.sample_period = god_map.qp_controller.sample_period
+        self.max_derivative = god_map.qp_controller.max_derivative
 
     @catch_and_raise_to_blackboard
     @record_time
@@ -22,11 +30,11 @@ class RealKinSimPlugin(GiskardBehavior):
         next_time = god_map.time
         if next_time <= 0.0 or self.last_time is None:
             self.last_time = next_time
-            return Status.RUNNING
+            return RUNNING
         next_cmds = god_map.qp_solver_solution
         dt = next_time - self.last_time
-        if dt > god_map.qp_controller.sample_period:
-            dt = god_map.qp_controller.sample_period
-        god_map.world.update_state(next_cmds, dt, max_derivative=god_map.qp_controller.max_derivative)
+        if dt > self.sample_period:
+            dt = self.sample_period
+        god_map.world.update_state(next_cmds, dt, max_derivative=self.max_derivative)
         self.last_time = next_time
-        return Status.RUNNING
+        return RUNNING
@@ -14,6 +14,8 @@ from giskardpy.model.joints import OmniDrive, DiffDrive
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+RUNNING = Status.RUNNING
+
 
 # can be used during closed-loop control, instead of for tracking a trajectory
 class SendCmdVel(GiskardBehavior, ABC):
@@ -78,7 +80,7 @@ class SendCmdVel(GiskardBehavior, ABC):
         cmd = god_map.qp_solver_solution
         twist = self.solver_cmd_to_twist(cmd)
         self.vel_pub.publish(twist)
-        return Status.RUNNING
+        return RUNNING
 
     def terminate(self, new_status):
         self.vel_pub.publish(Twist())
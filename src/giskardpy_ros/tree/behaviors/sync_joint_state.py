@@ -13,6 +13,10 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 import giskardpy_ros.ros1.msg_converter as msg_converter
 
+SUCCESS = Status.SUCCESS
+RUNNING = Status.RUNNING
+
+
 class SyncJointState(GiskardBehavior):
 
     @record_time
@@ -42,8 +46,8 @@ class SyncJointState(GiskardBehavior):
             mjs = msg_converter.ros_joint_state_to_giskard_joint_state(self.data, self.group_name)
             god_map.world.state.update(mjs)
             self.data = None
-            return Status.SUCCESS
-        return Status.RUNNING
+            return SUCCESS
+        return RUNNING
 
     def __str__(self):
         return f'{super().__str__()} ({self.joint_state_topic})'
@@ -90,4 +94,4 @@ class SyncJointStatePosition(GiskardBehavior):
             joint_name = PrefixName(joint_name, self.group_name)
             god_map.world.state[joint_name][Derivatives.position] = position
 
-        return Status.SUCCESS
+        return SUCCESS
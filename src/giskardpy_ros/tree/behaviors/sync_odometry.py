@@ -12,6 +12,9 @@ from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 from giskardpy.utils.decorators import record_time
 
+SUCCESS = Status.SUCCESS
+RUNNING = Status.RUNNING
+
 
 class SyncOdometry(GiskardBehavior):
 
@@ -48,9 +51,9 @@ class SyncOdometry(GiskardBehavior):
         if self.data:
             self.joint.update_transform(self.data.pose.pose)
             self.data = None
-            return Status.SUCCESS
+            return SUCCESS
         else:
-            return Status.RUNNING
+            return RUNNING
 
 
 class SyncOdometryNoLock(SyncOdometry):
@@ -70,4 +73,4 @@ class SyncOdometryNoLock(SyncOdometry):
     @profile
     def update(self):
         self.joint.update_transform(self.odom.pose.pose)
-        return Status.SUCCESS
+        return SUCCESS
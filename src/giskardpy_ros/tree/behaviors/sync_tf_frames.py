@@ -11,6 +11,8 @@ from giskardpy_ros.ros1.tfwrapper import lookup_pose
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.tree.blackboard_utils import catch_and_raise_to_blackboard
 
+SUCCESS = Status.SUCCESS
+
 
 class SyncTfFrames(GiskardBehavior):
     joint_map: Dict[PrefixName, Tuple[str, str]]
@@ -41,4 +43,4 @@ class SyncTfFrames(GiskardBehavior):
             parent_T_child = lookup_pose(tf_parent_frame, tf_child_frame)
             joint.update_transform(parent_T_child.pose)
 
-        return Status.SUCCESS
+        return SUCCESS
@@ -1,17 +1,23 @@
 from enum import Enum
+from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import rospy
 from geometry_msgs.msg import TransformStamped
 from line_profiler import profile
 from py_trees import Status
 from tf2_msgs.msg import TFMessage
 
+from giskardpy.data_types.data_types import PrefixName
 from giskardpy.god_map import god_map
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 from giskardpy.utils.decorators import record_time
 from giskardpy_ros.ros1.tfwrapper import normalize_quaternion_msg
 import giskardpy_ros.ros1.msg_converter as msg_converter
 
+SUCCESS = Status.SUCCESS
+
+
 class TfPublishingModes(Enum):
     nothing = 0
     all = 1
@@ -29,62 +35,120 @@ class TFPublisher(GiskardBehavior):
     @profile
     def __init__(self, name: str, mode: TfPublishingModes, tf_topic: str = 'tf', include_prefix: bool = True):
         super().__init__(name)
-        self.original_links = set(god_map.world.link_names_as_set)
+        self.original_links = frozenset(god_map.world.link_names_as_set)
         self.tf_pub = rospy.Publisher(tf_topic, TFMessage, queue_size=10)
         self.mode = mode
         self.robot_names = god_map.collision_scene.robot_names
         self.include_prefix = include_prefix
+        self.transforms: Dict[str, TransformStamped] = {}
+        self.world_version: Optional[int] = None
+        self.attached_transforms: List[Tuple[int, str, str]] = []
+        self.world_object_links: List[PrefixName] = []
+
+    def update_frames(self, world) -> None:
+        """
+        Attached links and world objects only change with the world model,
+        so they are only searched again if its version changed.
+        attached_transforms: index into the batched fk of the world, parent frame and child frame of each attached link
+        world_object_links: root links of all groups without joints, that don't belong to a robot
+        """
+        if self.world_version != world.model_version:
+            robot_links = set()
+            for robot_name in self.robot_names:
+                robot_links.update(world.groups[robot_name].link_names_as_set)
+            attached_links = robot_links - self.original_links
+            attached_transforms = []
+            for i, (parent_link_name, link_name) in enumerate(world._fk_computer.tf):
+                if link_name not in attached_links:
+                    continue
+                if self.include_prefix:
+                    attached_transforms.append((i, str(parent_link_name), str(link_name)))
+                else:
+                    attached_transforms.append((i, str(parent_link_name), str(link_name.short_name)))
+            self.attached_transforms = attached_transforms
+            self.world_object_links = [group.root_link_name for group_name, group in world.groups.items()
+                                       # robot frames will exist for sure
+                                       if group_name not in self.robot_names and len(group.joints) == 0]
+            # forget the msgs of frames that were detached or deleted
+            current_frames = {child_frame for _, _, child_frame in self.attached_transforms}
+            current_frames.update(str(link_name) for link_name in self.world_object_links)
+            self.transforms = {frame: tf for frame, tf in self.transforms.items() if frame in current_frames}
+            self.world_version = world.model_version
 
-    def make_transform(self, parent_frame, child_frame, pose):
-        tf = TransformStamped()
+    def get_transform(self, parent_frame: str, child_frame: str, stamp: rospy.Time) -> TransformStamped:
+        # rospy serializes in publish, so the msg of each child frame can be reused in the next tick
+        try:
+            tf = self.transforms[child_frame]
+        except KeyError:
+            tf = TransformStamped()
+            tf.child_frame_id = child_frame
+            self.transforms[child_frame] = tf
         tf.header.frame_id = parent_frame
-        tf.header.stamp = rospy.get_rostime()
-        tf.child_frame_id = child_frame
+        tf.header.stamp = stamp
+        return tf
+
+    def make_transform(self, parent_frame, child_frame, pose, stamp: rospy.Time):
+        tf = self.get_transform(parent_frame, child_frame, stamp)
         tf.transform.translation.x = pose.position.x
         tf.transform.translation.y = pose.position.y
         tf.transform.translation.z = pose.position.z
-        tf.transform.rotation = normalize_quaternion_msg(pose.orientation)
+        q = pose.orientation
+        # fk results are unit quaternions up to numerical noise, only normalize if they are not
+        if abs(q.x * q.x + q.y * q.y + q.z * q.z + q.w * q.w - 1) > 1e-9:
+            q = normalize_quaternion_msg(q)
+        tf.transform.rotation.x = q.x
+        tf.transform.rotation.y = q.y
+        tf.transform.rotation.z = q.z
+        tf.transform.rotation.w = q.w
+        return tf
+
+    def make_transform_from_array(self, parent_frame: str, child_frame: str, pose: np.ndarray, stamp: rospy.Time) \
+            -> TransformStamped:
+        """
+        :param pose: [x, y, z, qx, qy, qz, qw], as returned by the fk computer of the world
+        """
+        tf = self.get_transform(parent_frame, child_frame, stamp)
+        tf.transform.translation.x = pose[0]
+        tf.transform.translation.y = pose[1]
+        tf.transform.translation.z = pose[2]
+        tf.transform.rotation.x = pose[3]
+        tf.transform.rotation.y = pose[4]
+        tf.transform.rotation.z = pose[5]
+        tf.transform.rotation.w = pose[6]
         return tf
 
     @record_time
     @profile
     def update(self):
         try:
+            world = god_map.world
             if self.mode == TfPublishingModes.all:
-                self.tf_pub.publish(msg_converter.world_to_tf_message(god_map.world, self.include_prefix))
-            else:
-                tf_msg = TFMessage()
-                if self.mode in [TfPublishingModes.attached_objects, TfPublishingModes.attached_and_world_objects]:
-                    for robot_name in self.robot_names:
-                        robot_links = set(god_map.world.groups[robot_name].link_names_as_set)
-                    attached_links = robot_links - self.original_links
-                    if attached_links:
-                        get_fk = god_map.world.compute_fk
-                        for link_name in attached_links:
-                            parent_link_name = god_map.world.get_parent_link_of_link(link_name)
-                            fk = get_fk(parent_link_name, link_name)
-                            if self.include_prefix:
-                                tf = self.make_transform(fk.header.frame_id, str(link_name), fk.pose)
-                            else:
-                                tf = self.make_transform(fk.header.frame_id, str(link_name.short_name), fk.pose)
-                            tf_msg.transforms.append(tf)
+                self.tf_pub.publish(msg_converter.world_to_tf_message(world, self.include_prefix))
+                return SUCCESS
+            tf_msg = TFMessage()
+            # all transforms of one tick share one stamp
+            now = rospy.get_rostime()
+            self.update_frames(world)
+            if self.mode in [TfPublishingModes.attached_objects, TfPublishingModes.attached_and_world_objects]:
+                attached_transforms = self.attached_transforms
+                if attached_transforms:
+                    # one pass of the compiled fk for all joints, instead of one compute_fk per attached link
+                    poses = world._fk_computer.compute_tf()
+                    for i, parent_frame, child_frame in attached_transforms:
+                        tf = self.make_transform_from_array(parent_frame, child_frame, poses[i], now)
+                        tf_msg.transforms.append(tf)
             if self.mode in [TfPublishingModes.world_objects, TfPublishingModes.attached_and_world_objects]:
-                for group_name, group in god_map.world.groups.items():
-                    if group_name in self.robot_names:
-                        # robot frames will exist for sure
-                        continue
-                    if len(group.joints) > 0:
-                        continue
-                    get_fk = god_map.world.compute_fk
-                    fk = get_fk(god_map.world.root_link_name, group.root_link_name)
-                    tf = self.make_transform(fk.header.frame_id, str(group.root_link_name), fk.pose)
+                get_fk = world.compute_fk
+                root_link_name = world.root_link_name
+                for link_name in self.world_object_links:
+                    fk = get_fk(root_link_name, link_name)
+                    tf = self.make_transform(fk.header.frame_id, str(link_name), fk.pose, now)
                     tf_msg.transforms.append(tf)
+            if tf_msg.transforms:
                 self.tf_pub.publish(tf_msg)
 
         except KeyError as e:
             pass
-        except UnboundLocalError as e:
-            pass
         except ValueError as e:
             pass
-        return Status.SUCCESS
+        return SUCCESS
@@ -7,38 +7,47 @@ from py_trees import Status
 from giskardpy.god_map import god_map
 from giskardpy_ros.tree.behaviors.plugin import GiskardBehavior
 
+SUCCESS = Status.SUCCESS
+
 
 class TimePlugin(GiskardBehavior):
+    sample_period: float
+
     def __init__(self, name: Optional[str] = 'time'):
         super().__init__(name)
 
+    def initialise(self):
+        self.sample_period = god_map.qp_controller.sample_period
+
     @profile
     def update(self):
-        god_map.time += god_map.qp_controller.sample_period
-        return Status.SUCCESS
+        god_map.time += self.sample_period
+        return SUCCESS
 
 
 class ControlCycleCounter(GiskardBehavior):
 
-    @profile
     def __init__(self, name: Optional[str] = 'control cycle counter'):
         super().__init__(name)
 
     @profile
     def update(self):
         god_map.control_cycle_counter += 1
-        return Status.SUCCESS
+        return SUCCESS
 
 
 class RosTime(GiskardBehavior):
+    start_time: float
+
     def __init__(self, name: Optional[str] = 'ros time'):
         super().__init__(name)
 
-    @property
-    def start_time(self) -> float:
-        return god_map.motion_start_time
+    def initialise(self):
+        # motion_start_time is set before the control loop starts and stays fixed during a motion
+        self.start_time = god_map.motion_start_time
 
     @profile
     def update(self):
-        god_map.time = rospy.get_rostime().to_sec() - self.start_time
-        return Status.SUCCESS
\ No newline at end of file
+        now = rospy.get_rostime()
+        god_map.time = now.secs + now.nsecs * 1e-9 - self.start_time
+        return SUCCESS
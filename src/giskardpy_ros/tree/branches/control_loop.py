@@ -85,37 +85,34 @@ class ControlLoop(AsyncBehavior):
     @toggle_on('controller_active')
     def add_qp_controller(self):
         self.insert_behind(self.controller_plugin, self.check_monitors)
-        self.insert_behind(self.kin_sim, self.time)
+        if self.in_projection:
+            # kin sim is only part of the loop in projection, closed loop uses real kin sim
+            self.insert_behind(self.kin_sim, self.time)
 
     @toggle_off('controller_active')
     def remove_qp_controller(self):
-        self.remove_child(self.controller_plugin)
-        self.remove_child(self.kin_sim)
+        if self.in_projection:
+            self.remove_children([self.controller_plugin, self.kin_sim])
+        else:
+            self.remove_child(self.controller_plugin)
 
     def remove_projection_behaviors(self):
-        self.remove_child(self.projection_synchronization)
-        self.remove_child(self.time)
-        self.remove_child(self.kin_sim)
+        self.remove_children([self.projection_synchronization, self.time, self.kin_sim])
         # self.publish_state.remove_visualization_marker_behavior()
 
     def remove_closed_loop_behaviors(self):
-        self.remove_child(self.closed_loop_synchronization)
-        self.remove_child(self.ros_time)
-        self.remove_child(self.real_kin_sim)
-        self.remove_child(self.send_controls)
+        self.remove_children([self.closed_loop_synchronization, self.ros_time, self.real_kin_sim,
+                              self.send_controls])
 
     def add_projection_behaviors(self):
         # self.publish_state.add_visualization_marker_behavior(mode=VisualizationMode.CollisionsDecomposed)
         self.insert_child(self.projection_synchronization, 1)
-        self.insert_child(self.time, -2)
-        self.insert_child(self.kin_sim, -2)
+        self.insert_children([self.time, self.kin_sim], -2)
         self.in_projection = True
 
     def add_closed_loop_behaviors(self):
         self.insert_child(self.closed_loop_synchronization, 1)
-        self.insert_child(self.ros_time, -2)
-        self.insert_child(self.real_kin_sim, -2)
-        self.insert_child(self.send_controls, -2)
+        self.insert_children([self.ros_time, self.real_kin_sim, self.send_controls], -2)
         self.in_projection = False
 
     def add_evaluate_debug_expressions(self, log_traj: bool):
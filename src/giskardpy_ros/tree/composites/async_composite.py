@@ -1,7 +1,7 @@
 import traceback
 from threading import Thread
 from time import time
-from typing import Optional
+from typing import Optional, List
 
 import rospy
 from line_profiler import profile
@@ -57,6 +57,30 @@ class AsyncBehavior(GiskardBehavior, Composite):
         sibling_id = self.children.index(left_sibling_name)
         self.insert_child(node, sibling_id+1)
 
+    def insert_children(self, children: List[Behaviour], index: int) -> None:
+        """
+        Like insert_child, but inserts all children with a single list operation, keeping their order.
+        """
+        for child in children:
+            child.parent = self
+        self.children[index:index] = children
+
+    def remove_children(self, children: List[Behaviour]) -> None:
+        """
+        Like remove_child, but removes all children with a single pass over self.children.
+        :raises ValueError: if one of them is not a child, in which case nothing is removed
+        """
+        for child in children:
+            if child not in self.children:
+                raise ValueError(f'\'{child.name}\' is not a child of \'{self.name}\'.')
+        for child in children:
+            if self.current_child is child:
+                self.current_child = None
+            if child.status == Status.RUNNING:
+                child.stop(Status.INVALID)
+            child.parent = None
+        self.children[:] = [child for child in self.children if child not in children]
+
     def tick(self):
         self.logger.debug("%s.tick()" % self.__class__.__name__)
         # Required behaviour for *all* behaviours and composites is
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from sensor_msgs.msg import LaserScan
+
+from giskardpy_ros.goals.realtime_goals import compute_laser_thresholds
+
+
+def compute_laser_thresholds_per_beam(laser_scan: LaserScan, distance_threshold_width: float,
+                                      distance_threshold: float) -> np.ndarray:
+    """
+    The original loop over every beam, as reference for compute_laser_thresholds.
+    """
+    thresholds = []
+    if len(laser_scan.ranges) % 2 == 0:
+        angles = np.arange(laser_scan.angle_min,
+                           laser_scan.angle_max,
+                           laser_scan.angle_increment)[:-1]
+    else:
+        angles = np.arange(laser_scan.angle_min,
+                           laser_scan.angle_max,
+                           laser_scan.angle_increment)
+    for angle in angles:
+        if angle < 0:
+            y = -distance_threshold_width
+            length = y / np.sin((angle))
+            x = np.cos(angle) * length
+            thresholds.append((x, y, length, angle))
+        else:
+            y = distance_threshold_width
+            length = y / np.sin((angle))
+            x = np.cos(angle) * length
+            thresholds.append((x, y, length, angle))
+        if length > distance_threshold:
+            length = distance_threshold
+            x = np.cos(angle) * length
+            y = np.sin(angle) * length
+            thresholds[-1] = (x, y, length, angle)
+    return np.array(thresholds)
+
+
+@pytest.mark.parametrize('angle_min, number_of_beams', [
+    (-1.0, 8),  # even, has a beam at 0
+    (-1.0, 9),  # odd, has a beam at 0
+    (-0.0, 4),  # even, starts at -0
+    (-0.0, 5),  # odd, starts at -0
+])
+def test_compute_laser_thresholds(angle_min: float, number_of_beams: int):
+    # with width 0.4 and max distance 0.5, the beams at +-1 are not clamped, those closer to 0 are
+    laser_scan = LaserScan(angle_min=angle_min,
+                           angle_max=1.0 + 1e-9,
+                           angle_increment=0.25,
+                           ranges=[1.0] * number_of_beams)
+    with np.errstate(divide='ignore'):
+        expected = compute_laser_thresholds_per_beam(laser_scan, 0.4, 0.5)
+    actual = compute_laser_thresholds(laser_scan, 0.4, 0.5)
+    np.testing.assert_array_equal(actual, expected)
+    np.testing.assert_array_equal(np.signbit(actual), np.signbit(expected))
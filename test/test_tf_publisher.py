@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+from tf2_msgs.msg import TFMessage
+
+from giskardpy.data_types.data_types import PrefixName
+from giskardpy.god_map import god_map
+from giskardpy_ros.tree.behaviors.tf_publisher import TFPublisher, TfPublishingModes
+
+
+class TFMessageRecorder:
+    def __init__(self):
+        self.msgs: List[TFMessage] = []
+
+    def publish(self, msg: TFMessage) -> None:
+        self.msgs.append(msg)
+
+
+def fake_world(groups: Dict[str, List[PrefixName]],
+               joints: List[Tuple[PrefixName, PrefixName]],
+               model_version: int) -> SimpleNamespace:
+    """
+    Just enough of a world for TFPublisher: groups of links and one pose per joint from the batched fk.
+    The pose of joint i is [i, 0, 0, 0, 0, 0, 1].
+    """
+    poses = np.zeros((len(joints), 7))
+    poses[:, 0] = np.arange(len(joints))
+    poses[:, 6] = 1
+    world_groups = {group_name: SimpleNamespace(link_names_as_set=set(link_names),
+                                                root_link_name=link_names[0],
+                                                joints=joints)
+                    for group_name, link_names in groups.items()}
+    return SimpleNamespace(link_names_as_set={l for link_names in groups.values() for l in link_names},
+                           groups=world_groups,
+                           model_version=model_version,
+                           root_link_name=PrefixName('map'),
+                           _fk_computer=SimpleNamespace(tf=joints, compute_tf=lambda: poses))
+
+
+@pytest.fixture()
+def two_robots(ros, monkeypatch) -> Tuple[Dict[str, List[PrefixName]], List[Tuple[PrefixName, PrefixName]]]:
+    groups = {'robot1': [PrefixName('base', 'robot1'), PrefixName('hand', 'robot1')],
+              'robot2': [PrefixName('base', 'robot2'), PrefixName('hand', 'robot2')]}
+    joints = [(groups['robot1'][0], groups['robot1'][1]),
+              (groups['robot2'][0], groups['robot2'][1])]
+    monkeypatch.setattr(god_map, 'world', fake_world(groups, joints, model_version=0), raising=False)
+    monkeypatch.setattr(god_map, 'collision_scene', SimpleNamespace(robot_names=list(groups)), raising=False)
+    return groups, joints
+
+
+class TestTFPublisher:
+    def test_nothing_attached(self, two_robots):
+        tf_publisher = TFPublisher('tf', mode=TfPublishingModes.attached_objects)
+        tf_publisher.tf_pub = TFMessageRecorder()
+        tf_publisher.update()
+        assert tf_publisher.tf_pub.msgs == []
+
+    @pytest.mark.parametrize('robot_name', ['robot1', 'robot2'])
+    def test_attached_object(self, two_robots, monkeypatch, robot_name: str):
+        groups, joints = two_robots
+        tf_publisher = TFPublisher('tf', mode=TfPublishingModes.attached_objects)
+        tf_publisher.tf_pub = TFMessageRecorder()
+
+        hand = groups[robot_name][1]
+        box = PrefixName('box')
+        groups[robot_name].append(box)
+        joints.append((hand, box))
+        monkeypatch.setattr(god_map, 'world', fake_world(groups, joints, model_version=1))
+        tf_publisher.update()
+
+        assert len(tf_publisher.tf_pub.msgs) == 1
+        transforms = tf_publisher.tf_pub.msgs[0].transforms
+        assert len(transforms) == 1
+        assert transforms[0].header.frame_id == str(hand)
+        assert transforms[0].child_frame_id == str(box)
+        assert transforms[0].transform.translation.x == len(joints) - 1
+        assert transforms[0].transform.rotation.w == 1
@@ -3,6 +3,7 @@ import keyword
 import os
 from collections import defaultdict
 from copy import deepcopy
+from functools import lru_cache
 from time import time
 from typing import Tuple, Optional, List, Dict, Union
 
@@ -131,9 +132,9 @@ def compare_points(actual_point: Union[cas.Point3, Point], desired_point: Union[
         actual_point = msg_converter.to_ros_message(actual_point).point
     if isinstance(desired_point, cas.Point3):
         desired_point = msg_converter.to_ros_message(desired_point).point
-    np.testing.assert_almost_equal(actual_point.x, desired_point.x, decimal=decimal)
-    np.testing.assert_almost_equal(actual_point.y, desired_point.y, decimal=decimal)
-    np.testing.assert_almost_equal(actual_point.z, desired_point.z, decimal=decimal)
+    np.testing.assert_array_almost_equal([actual_point.x, actual_point.y, actual_point.z],
+                                         [desired_point.x, desired_point.y, desired_point.z],
+                                         decimal=decimal)
 
 
 def compare_orientations(actual_orientation: Union[Quaternion, np.ndarray],
@@ -153,16 +154,12 @@ def compare_orientations(actual_orientation: Union[Quaternion, np.ndarray],
                        desired_orientation.w])
     else:
         q2 = desired_orientation
-    try:
-        np.testing.assert_almost_equal(q1[0], q2[0], decimal=decimal)
-        np.testing.assert_almost_equal(q1[1], q2[1], decimal=decimal)
-        np.testing.assert_almost_equal(q1[2], q2[2], decimal=decimal)
-        np.testing.assert_almost_equal(q1[3], q2[3], decimal=decimal)
-    except:
-        np.testing.assert_almost_equal(q1[0], -q2[0], decimal=decimal)
-        np.testing.assert_almost_equal(q1[1], -q2[1], decimal=decimal)
-        np.testing.assert_almost_equal(q1[2], -q2[2], decimal=decimal)
-        np.testing.assert_almost_equal(q1[3], -q2[3], decimal=decimal)
+    q1 = np.asarray(q1, dtype=float)
+    q2 = np.asarray(q2, dtype=float)
+    # q and -q are the same orientation, compare against whichever sign is closer
+    if np.max(np.abs(q1 + q2)) < np.max(np.abs(q1 - q2)):
+        q2 = -q2
+    np.testing.assert_array_almost_equal(q1, q2, decimal=decimal)
 
 
 def position_dict_to_joint_states(joint_state_dict: Dict[str, float]) -> JointState:
@@ -179,6 +176,7 @@ def position_dict_to_joint_states(joint_state_dict: Dict[str, float]) -> JointSt
     return js
 
 
+@lru_cache(maxsize=None)
 def pr2_urdf():
     path = get_middleware().resolve_iri('package://giskardpy/test/urdfs/pr2_with_base.urdf')
     with open(path, 'r') as f:
@@ -186,30 +184,35 @@ def pr2_urdf():
     return urdf_string
 
 
+@lru_cache(maxsize=None)
 def pr2_without_base_urdf():
     with open('urdfs/pr2.urdf', 'r') as f:
         urdf_string = f.read()
     return urdf_string
 
 
+@lru_cache(maxsize=None)
 def base_bot_urdf():
     with open('urdfs/2d_base_bot.urdf', 'r') as f:
         urdf_string = f.read()
     return urdf_string
 
 
+@lru_cache(maxsize=None)
 def donbot_urdf():
     with open('urdfs/iai_donbot.urdf', 'r') as f:
         urdf_string = f.read()
     return urdf_string
 
 
+@lru_cache(maxsize=None)
 def boxy_urdf():
     with open('urdfs/boxy.urdf', 'r') as f:
         urdf_string = f.read()
     return urdf_string
 
 
+@lru_cache(maxsize=None)
 def hsr_urdf():
     with open('urdfs/hsr.urdf', 'r') as f:
         urdf_string = f.read()